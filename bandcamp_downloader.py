@@ -1,14 +1,90 @@
+import os
 import requests
 import shutil
 import subprocess
 import zipfile
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from pathlib import Path, PurePosixPath
 
 import typer
+import urllib3
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
 
 app = typer.Typer()
 
+MAX_PARALLEL_DOWNLOADS = 4
+CHUNK_SIZE = 1024 * 1024
+ZIP_MAGIC = b'PK\x03\x04'
+
+
+def make_session() -> requests.Session:
+    """Create a session whose connection pool can serve every parallel download."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=MAX_PARALLEL_DOWNLOADS, pool_maxsize=MAX_PARALLEL_DOWNLOADS)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def download(session: requests.Session, download_url: str, dest_dir: Path, position: int = 0) -> Path:
+    """Download a single URL into its own directory and return the file path."""
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    file_path = dest_dir / "download_file"
+
+    response = session.get(download_url, stream=True)
+    total_size = int(response.headers.get('content-length', 0))
+    response.raise_for_status()
+
+    # Copy straight from the raw socket stream in large blocks; the wrapped
+    # file ticks the progress bar on each write
+    response.raw.decode_content = True
+    with open(file_path, 'wb') as f, tqdm.wrapattr(f, "write", total=total_size, desc=f"Downloading #{position + 1}", position=position) as out:
+        try:
+            shutil.copyfileobj(response.raw, out, length=CHUNK_SIZE)
+        except urllib3.exceptions.HTTPError as e:
+            # Reading raw skips requests' mapping of mid-stream urllib3 errors
+            raise requests.RequestException(e) from e
+
+    return file_path
+
+
+def is_zip(file_path: Path) -> bool:
+    """Check for the local file header signature that starts every zip archive."""
+    with open(file_path, 'rb') as fh:
+        return fh.read(len(ZIP_MAGIC)) == ZIP_MAGIC
+
+
+def _extract_members(zip_path: Path, names: list[str], dest: Path):
+    """Extract one worker's share of the archive through a single handle."""
+    # Handles aren't shared between workers because a ZipFile has one file position
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        for name in names:
+            zip_ref.extract(name, dest)
+
+
+def extract_zip(zip_path: Path, dest: Path):
+    """Extract a zip archive, inflating its members in parallel."""
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        members = zip_ref.infolist()
+
+    # Create every target directory up front so workers don't race on mkdir.
+    # Path components are sanitized the same way ZipFile.extract does.
+    for member in members:
+        parts = [p for p in PurePosixPath(member.filename).parts if p not in ("/", ".", "..")]
+        target = dest.joinpath(*parts)
+        (target if member.is_dir() else target.parent).mkdir(parents=True, exist_ok=True)
+
+    names = [m.filename for m in members if not m.is_dir()]
+    if not names:
+        return
+    workers = min(os.cpu_count() or 1, len(names))
+    shares = [names[i::workers] for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(_extract_members, repeat(zip_path), shares, repeat(dest)))
+
+
 @app.command()
 def main(
     download_urls: list[str] = typer.Argument(..., help="One or more download URLs"),
@@ -17,46 +93,37 @@ def main(
     """Download and import Bandcamp purchases using beets."""
     print("=== Bandcamp Downloader ===")
 
-    for download_url in download_urls:
-        print(f"Downloading: {download_url}")
-        
-        # Clear download directory
-        temp_dir = Path(download_dir).expanduser()
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        
-        for item in temp_dir.iterdir():
-            if item.is_file():
-                item.unlink()
-            elif item.is_dir():
-                shutil.rmtree(item)
-        
-        # Set file path
-        file_path = temp_dir / "download_file"
-
-        # Download the file
+    # Start from an empty download directory. Only its contents are removed,
+    # so a symlinked or non-removable directory still works.
+    temp_dir = Path(download_dir).expanduser()
+    temp_dir.mkdir(parents=True, exist_ok=True)
+    for item in temp_dir.iterdir():
+        if item.is_dir() and not item.is_symlink():
+            shutil.rmtree(item)
+        else:
+            item.unlink()
+
+    # Download all files concurrently, each into its own subdirectory
+    with make_session() as session, ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_DOWNLOADS, len(download_urls))) as pool:
+        futures = []
+        for i, download_url in enumerate(download_urls):
+            print(f"Downloading: {download_url}")
+            futures.append(pool.submit(download, session, download_url, temp_dir / str(i), i))
+
+    # Extract and import one at a time, in the order given
+    for download_url, future in zip(download_urls, futures):
         try:
-            response = requests.get(download_url, stream=True)
-            total_size = int(response.headers.get('content-length', 0))
-            response.raise_for_status()
-            
-            with open(file_path, 'wb') as f:
-                with tqdm(total=total_size, unit='B', unit_scale=True, desc="Downloading") as pbar:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                            pbar.update(len(chunk))
-             
+            file_path = future.result()
         except requests.RequestException as e:
-            print(f"Error: Failed to download the file. Please check the URL and try again.")
+            print(f"Error: Failed to download {download_url}. Please check the URL and try again.")
             continue
-        
+
         # Extract if zip, otherwise use file directly
         import_path = file_path
-        if zipfile.is_zipfile(file_path):
+        if is_zip(file_path):
             print("Extracting zip file...")
-            with zipfile.ZipFile(file_path, 'r') as zip_ref:
-                zip_ref.extractall(temp_dir)
-            import_path = temp_dir
+            extract_zip(file_path, file_path.parent)
+            import_path = file_path.parent
 
         # Import the downloaded file using beets
         try:
@@ -67,4 +134,4 @@ def main(
             continue
 
 if __name__ == "__main__":
-    app()
\ No newline at end of file
+    app()
@@ -1,6 +1,7 @@
 """Main entry point for the new release notifier."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import typer
 
@@ -16,6 +17,14 @@ log = logging.getLogger(__name__)
 app = typer.Typer()
 
 
+def _check_artist(
+    mb_client: MusicBrainzClient, artist_name: str, mb_id: str, days_back: int
+) -> list[dict]:
+    """Fetch recent releases for a single artist (runs in a worker thread)."""
+    log.debug(f"Checking releases for: {artist_name}")
+    return mb_client.get_recent_releases(mb_id, days_back)
+
+
 @app.command()
 def main(
     config_path: str = typer.Option(
@@ -37,6 +46,9 @@ def main(
     health_check = HealthCheck(config.health_check)
     health_check.ping_start()
 
+    beets = None
+    db = None
+    mb_client = None
     try:
         # Initialize components
         beets = BeetsReader(config.databases.beets_db)
@@ -65,10 +77,9 @@ def main(
             log.info(f"Single artist mode: checking {artist}")
 
         # Filter out ignored artists
+        ignored_ids = db.get_ignored_ids(artists.values())
         artists_to_check = {
-            name: mb_id
-            for name, mb_id in artists.items()
-            if not db.is_artist_ignored(mb_id)
+            name: mb_id for name, mb_id in artists.items() if mb_id not in ignored_ids
         }
         if not artists_to_check:
             log.info("No artists to check after applying ignore list")
@@ -81,47 +92,71 @@ def main(
 
         log.info(f"Checking {len(artists_to_check)} artists for new releases")
 
-        # Check each artist for new releases
-        new_releases = []
-        for artist_name, mb_id in artists_to_check.items():
-            log.debug(f"Checking releases for: {artist_name}")
-
-            try:
-                releases = mb_client.get_recent_releases(
-                    mb_id, config.musicbrainz.release_window_days
+        # Check artists on a small pool. musicbrainzngs holds a lock for the
+        # whole HTTP call, so requests still go out one at a time; only the
+        # per-artist filtering overlaps. Database access stays on this thread.
+        found_releases = []
+        with ThreadPoolExecutor(max_workers=config.musicbrainz.max_workers) as pool:
+            futures = {
+                pool.submit(
+                    _check_artist,
+                    mb_client,
+                    artist_name,
+                    mb_id,
+                    config.musicbrainz.release_window_days,
+                ): artist_name
+                for artist_name, mb_id in artists_to_check.items()
+            }
+
+            # Collect in submission order so output follows the library's order
+            for future, artist_name in futures.items():
+                try:
+                    releases = future.result()
+                except Exception as e:
+                    log.error(f"Error checking {artist_name}: {e}")
+                    continue
+
+                found_releases.extend(
+                    {**release, "artist_name": artist_name} for release in releases
                 )
 
-                for release in releases:
-                    if not db.is_release_notified(release["id"]):
-                        new_releases.append({**release, "artist_name": artist_name})
-                        log.info(f"New release: {artist_name} - {release['title']}")
-
-            except Exception as e:
-                log.error(f"Error checking {artist_name}: {e}")
-
-        # Send notifications and record releases
-        notifications_sent = 0
-        for release in new_releases:
-            try:
-                notifier.send_release_notification(
-                    artist_name=release["artist_name"],
-                    title=release["title"],
-                    release_date=release["first_release_date"],
-                    release_type=release["type"],
-                )
-                db.add_notified_release(
-                    mb_releasegroupid=release["id"],
-                    artist_name=release["artist_name"],
-                    title=release["title"],
-                    release_date=release["first_release_date"],
-                    release_type=release["type"],
-                )
-                notifications_sent += 1
-            except Exception as e:
-                log.error(f"Error notifying release {release['title']}: {e}")
+        # Drop releases notified on earlier runs, in one lookup for the batch
+        new_ids = db.filter_new_release_ids(r["id"] for r in found_releases)
+        new_releases = []
+        for release in found_releases:
+            if release["id"] in new_ids:
+                new_releases.append(release)
+                log.info(f"New release: {release['artist_name']} - {release['title']}")
+
+        # Send notifications concurrently, then record the ones ntfy accepted
+        # in one write, even if the run is interrupted partway
+        messages = [
+            notifier.format_release(
+                release["artist_name"],
+                release["title"],
+                release["first_release_date"],
+                release["type"],
+            )
+            for release in new_releases
+        ]
+        notified_rows = []
+        try:
+            for release, sent in zip(new_releases, notifier.send_many(messages)):
+                if sent:
+                    notified_rows.append(
+                        (
+                            release["id"],
+                            release["artist_name"],
+                            release["title"],
+                            release["first_release_date"],
+                            release["type"],
+                        )
+                    )
+        finally:
+            db.add_notified_releases(notified_rows)
 
         log.info(
-            f"Done. New releases: {len(new_releases)}, Notifications sent: {notifications_sent}"
+            f"Done. New releases: {len(new_releases)}, Notifications sent: {len(notified_rows)}"
         )
         health_check.ping(success=True)
 
@@ -134,6 +169,12 @@ def main(
         health_check.ping(success=False)
 
     finally:
+        if beets is not None:
+            beets.close()
+        if db is not None:
+            db.close()
+        if mb_client is not None:
+            mb_client.close()
         log.info("+-+-+-+-+-END-NEW_RELEASE_NOTIFIER-+-+-+-+-+")
 
 
@@ -2,6 +2,8 @@
 
 import sqlite3
 import logging
+import threading
+from collections.abc import Iterator
 from pathlib import Path
 
 log = logging.getLogger(__name__)
@@ -14,91 +16,121 @@ class BeetsReader:
         self.db_path = db_path
         if not Path(db_path).exists():
             raise FileNotFoundError(f"Beets database not found: {db_path}")
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
 
     def _get_connection(self):
-        """Get a read-only database connection."""
-        conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
-        conn.row_factory = sqlite3.Row
+        """Get this thread's read-only database connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False
+            )
+            conn.row_factory = sqlite3.Row
+            # Read through a memory map with a 64 MB page cache, keep the
+            # temp b-trees for DISTINCT/GROUP BY in memory, and refuse writes
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA cache_size=-65536")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA query_only=1")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
         return conn
 
+    def close(self):
+        """Close all connections opened by this reader."""
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
     def get_artist_mb_id(self, artist_name: str) -> str | None:
         """Get MB artist ID by album artist name (case-insensitive)."""
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                """
-                SELECT DISTINCT mb_albumartistid
-                FROM albums
-                WHERE LOWER(albumartist) = LOWER(?)
-                AND mb_albumartistid IS NOT NULL
-                AND mb_albumartistid != ''
-                LIMIT 1
-                """,
-                (artist_name,),
-            )
-            result = cursor.fetchone()
-            return result[0] if result else None
+        conn = self._get_connection()
+        cursor = conn.execute(
+            """
+            SELECT DISTINCT mb_albumartistid
+            FROM albums
+            WHERE LOWER(albumartist) = LOWER(?)
+            AND mb_albumartistid IS NOT NULL
+            AND mb_albumartistid != ''
+            LIMIT 1
+            """,
+            (artist_name,),
+        )
+        result = cursor.fetchone()
+        return result[0] if result else None
+
+    def iter_artists_with_mb_ids(self) -> Iterator[tuple[str, str]]:
+        """Yield (artist_name, mb_id) for all artists with MB IDs, as rows are read."""
+        cursor = self._get_connection().cursor()
+        # Plain tuples are already (name, mb_id) pairs, so skip sqlite3.Row
+        # and let callers like dict() consume the cursor directly
+        cursor.row_factory = None
+        return cursor.execute(
+            """
+            SELECT DISTINCT albumartist, mb_albumartistid
+            FROM albums
+            WHERE mb_albumartistid IS NOT NULL
+            AND mb_albumartistid != ''
+            GROUP BY mb_albumartistid
+            """
+        )
 
     def get_all_artists_with_mb_ids(self) -> dict[str, str]:
         """Return {artist_name: mb_id} for all artists with MB IDs."""
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                """
-                SELECT DISTINCT albumartist, mb_albumartistid
-                FROM albums
-                WHERE mb_albumartistid IS NOT NULL
-                AND mb_albumartistid != ''
-                GROUP BY mb_albumartistid
-                """
-            )
-            return {row["albumartist"]: row["mb_albumartistid"] for row in cursor}
+        return dict(self.iter_artists_with_mb_ids())
 
     def get_all_artists(self) -> set[str]:
         """Return set of all artist names in beets."""
-        with self._get_connection() as conn:
-            cursor = conn.execute("SELECT DISTINCT albumartist FROM albums")
-            return {row[0] for row in cursor}
+        conn = self._get_connection()
+        cursor = conn.execute("SELECT DISTINCT albumartist FROM albums")
+        return {row[0] for row in cursor}
 
     def get_albums_for_artist(self, artist_name: str) -> list[dict]:
         """Get album details including MB release group IDs."""
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                """
-                SELECT album, mb_releasegroupid, mb_albumid, year
-                FROM albums
-                WHERE albumartist = ?
-                """,
-                (artist_name,),
-            )
-            return [dict(row) for row in cursor]
+        conn = self._get_connection()
+        cursor = conn.execute(
+            """
+            SELECT album, mb_releasegroupid, mb_albumid, year
+            FROM albums
+            WHERE albumartist = ?
+            """,
+            (artist_name,),
+        )
+        return [dict(row) for row in cursor]
 
     def get_coverage_stats(self) -> dict:
         """Get statistics about MB ID coverage."""
-        with self._get_connection() as conn:
-            stats = {}
-
-            cursor = conn.execute("SELECT COUNT(*) FROM albums")
-            stats["total_albums"] = cursor.fetchone()[0]
-
-            cursor = conn.execute(
-                """SELECT COUNT(*) FROM albums
-                   WHERE mb_albumartistid IS NOT NULL AND mb_albumartistid != ''"""
+        conn = self._get_connection()
+        row = conn.execute(
+            """
+            SELECT
+                COUNT(*),
+                SUM(CASE WHEN mb_albumartistid IS NOT NULL AND mb_albumartistid != ''
+                    THEN 1 ELSE 0 END),
+                COUNT(DISTINCT albumartist),
+                COUNT(DISTINCT CASE WHEN mb_albumartistid IS NOT NULL
+                    AND mb_albumartistid != '' THEN albumartist END)
+            FROM albums
+            """
+        ).fetchone()
+
+        stats = {
+            "total_albums": row[0],
+            "albums_with_mb_id": row[1] or 0,
+            "total_artists": row[2],
+            "artists_with_mb_id": row[3],
+        }
+
+        if stats["total_artists"] > 0:
+            stats["coverage_pct"] = round(
+                100 * stats["artists_with_mb_id"] / stats["total_artists"], 1
             )
-            stats["albums_with_mb_id"] = cursor.fetchone()[0]
-
-            cursor = conn.execute("SELECT COUNT(DISTINCT albumartist) FROM albums")
-            stats["total_artists"] = cursor.fetchone()[0]
-
-            cursor = conn.execute(
-                """SELECT COUNT(DISTINCT albumartist) FROM albums
-                   WHERE mb_albumartistid IS NOT NULL AND mb_albumartistid != ''"""
-            )
-            stats["artists_with_mb_id"] = cursor.fetchone()[0]
-
-            if stats["total_artists"] > 0:
-                stats["coverage_pct"] = round(
-                    100 * stats["artists_with_mb_id"] / stats["total_artists"], 1
-                )
-            else:
-                stats["coverage_pct"] = 0.0
+        else:
+            stats["coverage_pct"] = 0.0
 
-            return stats
+        return stats
@@ -1,12 +1,24 @@
 """Configuration settings for the new release notifier."""
 
+import functools
+import hashlib
+import json
+import os
+
 import yaml
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
 
 
 class DatabasePaths(BaseModel):
     """Database path configurations."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     beets_db: str = ""  # Path to beets musiclibrary.db
     notifications_db: str = "data/notifications.db"  # Path to notifications.db
 
@@ -14,21 +26,29 @@ class DatabasePaths(BaseModel):
 class MusicBrainzConfig(BaseModel):
     """MusicBrainz API configuration settings."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     user_agent: str = "ReleaseNotifier"
     version: float = 1.0
     contact: str = ""
     rate_limit_delay: float = 1.1
+    rate_limit_file: str = ""  # share rate limiting across processes via this file
     max_retries: int = 3
     initial_backoff: int = 1  # seconds
     max_backoff: int = 60  # seconds
     excluded_release_types: list[str] = []
     included_release_types: list[str] = []
     release_window_days: int = 30
+    max_workers: int = 4  # concurrent artist checks
+    cache_dir: str = ""  # persist fetched discographies across runs when set
+    cache_expiry_hours: int = 12
 
 
 class NtfyConfig(BaseModel):
     """ntfy notification service configuration settings."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     topic: str = ""
     token: str = ""
 
@@ -36,6 +56,8 @@ class NtfyConfig(BaseModel):
 class HealthCheckConfig(BaseModel):
     """Health check configuration settings."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     url: str = ""
     timeout: int = 10  # seconds
 
@@ -43,16 +65,101 @@ class HealthCheckConfig(BaseModel):
 class AppConfig(BaseModel):
     """Application configuration settings."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     databases: DatabasePaths = DatabasePaths()
     musicbrainz: MusicBrainzConfig = MusicBrainzConfig()
     ntfy: NtfyConfig = NtfyConfig()
     health_check: HealthCheckConfig = HealthCheckConfig()
 
 
-def load_config(yaml_path: str = "data/app_config.yml") -> AppConfig:
-    """Load configuration from a YAML file."""
+# Parsed configs by absolute path, with the SHA-256 of the YAML they came from
+_config_cache: dict[str, tuple[str, AppConfig]] = {}
+
+
+def _sidecar_path(path: str) -> str:
+    """Path of the validated JSON copy kept next to a YAML config."""
+    head, tail = os.path.split(path)
+    return os.path.join(head, f".{tail}.json")
+
+
+def _construct(model: type[BaseModel], data: dict) -> BaseModel:
+    """Build a model and its nested submodels from trusted data, skipping validation."""
+    values = {}
+    for name, field in model.model_fields.items():
+        if name not in data:
+            continue
+        value = data[name]
+        annotation = field.annotation
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            value = _construct(annotation, value)
+        values[name] = value
+    return model.model_construct(**values)
+
+
+@functools.lru_cache(maxsize=1)
+def _schema_fingerprint() -> str:
+    """Hash of the config schema and defaults, to invalidate old sidecars."""
+    schema = json.dumps(AppConfig.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(schema.encode()).hexdigest()
+
+
+def _load_sidecar(path: str, digest: str) -> AppConfig | None:
+    """Load the JSON sidecar if it matches this YAML and the current schema."""
+    try:
+        with open(_sidecar_path(path), "rb") as file:
+            sidecar = json.load(file)
+        if (
+            sidecar["source_sha256"] != digest
+            or sidecar["schema"] != _schema_fingerprint()
+        ):
+            return None
+        return _construct(AppConfig, sidecar["config"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_sidecar(path: str, digest: str, config: AppConfig):
+    """Save a validated config next to its YAML, replacing any older copy."""
+    sidecar = _sidecar_path(path)
+    tmp = f"{sidecar}.{os.getpid()}.tmp"
+    sidecar_data = {
+        "source_sha256": digest,
+        "schema": _schema_fingerprint(),
+        # Only values the YAML set, so defaults always come from the code
+        "config": config.model_dump(exclude_unset=True),
+    }
+    try:
+        # Owner-only: the config holds secrets such as the ntfy token
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "w") as file:
+            json.dump(sidecar_data, file)
+        os.replace(tmp, sidecar)
+    except OSError:
+        # Read-only config directory; every cold load just parses the YAML
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
 
-    with open(yaml_path, "r") as file:
-        config_data = yaml.safe_load(file)
 
-    return AppConfig(**config_data)
+def load_config(yaml_path: str = "data/app_config.yml") -> AppConfig:
+    """Load configuration from a YAML file, cached until the file changes."""
+    path = os.path.abspath(yaml_path)
+    # Keyed on content, not mtime, which copies and coarse timestamps can preserve
+    with open(path, "rb") as file:
+        raw = file.read()
+    digest = hashlib.sha256(raw).hexdigest()
+    cached = _config_cache.get(path)
+    if cached is not None and cached[0] == digest:
+        return cached[1]
+
+    # A validated sidecar from an earlier process skips YAML parsing and validation
+    config = _load_sidecar(path, digest)
+    if config is None:
+        config_data = yaml.load(raw, Loader=SafeLoader)
+        config = AppConfig(**config_data)
+        _write_sidecar(path, digest, config)
+
+    _config_cache[path] = (digest, config)
+    return config
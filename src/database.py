@@ -2,42 +2,108 @@
 
 import sqlite3
 import logging
+import uuid
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 log = logging.getLogger(__name__)
 
+# Stay below SQLite's default limit on bound parameters per statement
+MAX_QUERY_PARAMS = 900
+
+# PRAGMA user_version once MBIDs are stored as 16-byte BLOBs
+SCHEMA_VERSION = 1
+
+# Parent directories already created this process, to skip repeat mkdir calls
+_ensured_dirs: set[Path] = set()
+
+
+def _uuid_bytes(mb_id: str) -> bytes | str:
+    """Pack an MBID into its 16-byte form; anything that isn't a UUID is kept as-is."""
+    try:
+        return uuid.UUID(mb_id).bytes
+    except ValueError:
+        return mb_id
+
+
+def _uuid_str(value: bytes | str) -> str:
+    """Unpack a stored MBID back to its canonical string form."""
+    if isinstance(value, bytes):
+        return str(uuid.UUID(bytes=value))
+    return value
+
 
 class NotificationDatabase:
     """Simplified database for tracking ignored artists and notified releases."""
 
+    # Statements run per artist/release are kept as constants so sqlite3's
+    # statement cache always hits on the same string
+    _SQL_IS_IGNORED = "SELECT 1 FROM ignored_artists WHERE mb_albumartistid = ?"
+    _SQL_IGNORE_ARTIST = (
+        "INSERT OR IGNORE INTO ignored_artists (mb_albumartistid) VALUES (?)"
+    )
+    _SQL_UNIGNORE_ARTIST = "DELETE FROM ignored_artists WHERE mb_albumartistid = ?"
+    _SQL_IS_NOTIFIED = "SELECT 1 FROM releases WHERE mb_releasegroupid = ?"
+    _SQL_INSERT_RELEASE = """
+        INSERT OR IGNORE INTO releases
+        (mb_releasegroupid, artist_name, title, release_date, release_type)
+        VALUES (?, ?, ?, ?, ?)
+    """
+
     def __init__(self, db_path: str):
         self.db_path = db_path
         if db_path != ":memory:":
-            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            parent = Path(db_path).parent
+            if parent not in _ensured_dirs:
+                parent.mkdir(parents=True, exist_ok=True)
+                _ensured_dirs.add(parent)
 
-        if db_path == ":memory:":
-            self._conn = sqlite3.connect(db_path)
-            self._conn.row_factory = sqlite3.Row
-            self.init_database()
-        else:
-            self._conn = None
-            self.init_database()
+        self._conn = self._connect()
+        self.init_database()
 
-    def _get_connection(self):
-        """Get a database connection."""
-        if self._conn:
-            return self._conn
-        conn = sqlite3.connect(self.db_path)
+    def _connect(self):
+        """Open a new connection with the tuning PRAGMAs applied."""
+        conn = sqlite3.connect(self.db_path, cached_statements=256)
         conn.row_factory = sqlite3.Row
+        if self.db_path != ":memory:":
+            # WAL makes commits cheap and lets readers run alongside a writer;
+            # NORMAL sync is durable enough in WAL mode
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        conn.execute("PRAGMA mmap_size=268435456")
         return conn
 
+    def _get_connection(self):
+        """Get the database connection held for the lifetime of the instance."""
+        return self._conn
+
+    def close(self):
+        """Close the database connection, refreshing query planner stats first."""
+        self._conn.execute("PRAGMA optimize")
+        self._conn.close()
+
+    @contextmanager
+    def bulk(self) -> Iterator[sqlite3.Connection]:
+        """Run the yielded connection's statements as one transaction."""
+        conn = self._get_connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
     def init_database(self):
         """Initialize the database schema."""
         with self._get_connection() as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS ignored_artists (
-                    mb_albumartistid TEXT PRIMARY KEY
+                    mb_albumartistid BLOB PRIMARY KEY
                 )
                 """
             )
@@ -46,7 +112,7 @@ class NotificationDatabase:
                 """
                 CREATE TABLE IF NOT EXISTS releases (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    mb_releasegroupid TEXT UNIQUE NOT NULL,
+                    mb_releasegroupid BLOB UNIQUE NOT NULL,
                     artist_name TEXT NOT NULL,
                     title TEXT NOT NULL,
                     release_date TEXT,
@@ -56,44 +122,110 @@ class NotificationDatabase:
                 """
             )
 
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_releases_releasegroupid ON releases (mb_releasegroupid)"
-            )
+            # mb_releasegroupid is UNIQUE, which already gives it an index;
+            # a second one only added write cost
+            conn.execute("DROP INDEX IF EXISTS idx_releases_releasegroupid")
+
+        self._migrate_ids_to_blob()
+
+    def _migrate_ids_to_blob(self):
+        """Convert MBIDs stored as TEXT by older versions to 16-byte BLOBs."""
+        conn = self._get_connection()
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            return
+
+        with self.bulk() as conn:
+            for table, column in (
+                ("ignored_artists", "mb_albumartistid"),
+                ("releases", "mb_releasegroupid"),
+            ):
+                cursor = conn.execute(
+                    f"SELECT rowid, {column} FROM {table} "
+                    f"WHERE typeof({column}) = 'text'"
+                )
+                updates = [
+                    (packed, rowid)
+                    for rowid, value in cursor.fetchall()
+                    if isinstance(packed := _uuid_bytes(value), bytes)
+                ]
+                conn.executemany(
+                    f"UPDATE OR REPLACE {table} SET {column} = ? WHERE rowid = ?",
+                    updates,
+                )
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _select_matching(self, query: str, mb_ids: Iterable[str]) -> set[str]:
+        """Run a chunked IN (...) query over MBIDs and return the ones that matched."""
+        packed = {_uuid_bytes(mb_id): mb_id for mb_id in mb_ids}
+        values = list(packed)
+        matched = set()
+        with self._get_connection() as conn:
+            for start in range(0, len(values), MAX_QUERY_PARAMS):
+                chunk = values[start : start + MAX_QUERY_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = conn.execute(query.format(placeholders=placeholders), chunk)
+                matched.update(packed[row[0]] for row in cursor)
+        return matched
 
     def is_artist_ignored(self, mb_id: str) -> bool:
         """Check if an artist is in the ignored list."""
         with self._get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT 1 FROM ignored_artists WHERE mb_albumartistid = ?",
-                (mb_id,),
-            )
+            cursor = conn.execute(self._SQL_IS_IGNORED, (_uuid_bytes(mb_id),))
             return cursor.fetchone() is not None
 
+    def get_ignored_ids(self, mb_ids: Iterable[str]) -> set[str]:
+        """Return which of the given artist MB IDs are in the ignored list."""
+        return self._select_matching(
+            "SELECT mb_albumartistid FROM ignored_artists "
+            "WHERE mb_albumartistid IN ({placeholders})",
+            mb_ids,
+        )
+
     def ignore_artist(self, mb_id: str):
         """Add an artist to the ignored list."""
         with self._get_connection() as conn:
-            conn.execute(
-                "INSERT OR IGNORE INTO ignored_artists (mb_albumartistid) VALUES (?)",
-                (mb_id,),
-            )
+            conn.execute(self._SQL_IGNORE_ARTIST, (_uuid_bytes(mb_id),))
 
     def unignore_artist(self, mb_id: str):
         """Remove an artist from the ignored list."""
         with self._get_connection() as conn:
-            conn.execute(
-                "DELETE FROM ignored_artists WHERE mb_albumartistid = ?",
-                (mb_id,),
+            conn.execute(self._SQL_UNIGNORE_ARTIST, (_uuid_bytes(mb_id),))
+
+    def ignore_artists(self, mb_ids: Iterable[str]):
+        """Add many artists to the ignored list in a single transaction."""
+        with self.bulk() as conn:
+            conn.executemany(
+                self._SQL_IGNORE_ARTIST, [(_uuid_bytes(mb_id),) for mb_id in mb_ids]
+            )
+
+    def unignore_artists(self, mb_ids: Iterable[str]):
+        """Remove many artists from the ignored list in a single transaction."""
+        with self.bulk() as conn:
+            conn.executemany(
+                self._SQL_UNIGNORE_ARTIST, [(_uuid_bytes(mb_id),) for mb_id in mb_ids]
             )
 
     def is_release_notified(self, mb_releasegroupid: str) -> bool:
         """Check if a release has already been notified."""
         with self._get_connection() as conn:
             cursor = conn.execute(
-                "SELECT 1 FROM releases WHERE mb_releasegroupid = ?",
-                (mb_releasegroupid,),
+                self._SQL_IS_NOTIFIED, (_uuid_bytes(mb_releasegroupid),)
             )
             return cursor.fetchone() is not None
 
+    def get_notified_ids(self, mb_releasegroupids: Iterable[str]) -> set[str]:
+        """Return which of the given release group IDs have already been notified."""
+        return self._select_matching(
+            "SELECT mb_releasegroupid FROM releases "
+            "WHERE mb_releasegroupid IN ({placeholders})",
+            mb_releasegroupids,
+        )
+
+    def filter_new_release_ids(self, mb_releasegroupids: Iterable[str]) -> set[str]:
+        """Return the given release group IDs that have not been notified yet."""
+        ids = set(mb_releasegroupids)
+        return ids - self.get_notified_ids(ids)
+
     def add_notified_release(
         self,
         mb_releasegroupid: str,
@@ -105,29 +237,42 @@ class NotificationDatabase:
         """Record a release as notified."""
         with self._get_connection() as conn:
             conn.execute(
-                """
-                INSERT OR IGNORE INTO releases
-                (mb_releasegroupid, artist_name, title, release_date, release_type)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (mb_releasegroupid, artist_name, title, release_date, release_type),
+                self._SQL_INSERT_RELEASE,
+                (
+                    _uuid_bytes(mb_releasegroupid),
+                    artist_name,
+                    title,
+                    release_date,
+                    release_type,
+                ),
+            )
+
+    def add_notified_releases(self, rows: list[tuple]):
+        """Record many releases as notified in a single transaction."""
+        # Rows are (mb_releasegroupid, artist_name, title, release_date, release_type)
+        if not rows:
+            return
+        with self.bulk() as conn:
+            conn.executemany(
+                self._SQL_INSERT_RELEASE,
+                [(_uuid_bytes(row[0]), *row[1:]) for row in rows],
             )
 
     def get_stats(self) -> dict:
         """Get database statistics."""
         with self._get_connection() as conn:
-            stats = {}
-
-            cursor = conn.execute("SELECT COUNT(*) FROM ignored_artists")
-            stats["ignored_artists"] = cursor.fetchone()[0]
-
-            cursor = conn.execute("SELECT COUNT(*) FROM releases")
-            stats["notified_releases"] = cursor.fetchone()[0]
+            row = conn.execute(
+                """
+                SELECT
+                    (SELECT COUNT(*) FROM ignored_artists),
+                    (SELECT COUNT(*) FROM releases)
+                """
+            ).fetchone()
 
-            return stats
+            return {"ignored_artists": row[0], "notified_releases": row[1]}
 
     def get_ignored_artists(self) -> list[str]:
         """Get all ignored artist MB IDs."""
         with self._get_connection() as conn:
             cursor = conn.execute("SELECT mb_albumartistid FROM ignored_artists")
-            return [row[0] for row in cursor.fetchall()]
+            return [_uuid_str(row[0]) for row in cursor]
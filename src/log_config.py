@@ -1,7 +1,14 @@
 import logging
 
+_configured = False
+
 
 def basic_config(verbose: bool = False):
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
     level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
         level=level,
@@ -1,15 +1,28 @@
 """MusicBrainz API client."""
 
+import diskcache
+import functools
 import musicbrainzngs
 import time
 import random
 import logging
-from datetime import datetime, timedelta
+import os
+import socket
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from pathlib import Path
 
 from src.config import MusicBrainzConfig
 
 log = logging.getLogger(__name__)
 
+# Largest page the MusicBrainz browse endpoints will return
+BROWSE_PAGE_SIZE = 100
+
+# Artists whose discographies are kept in memory; the oldest are evicted first
+RELEASE_GROUP_CACHE_SIZE = 4096
+
 
 class ConnectionTimeoutError(Exception):
     """Raised when the connection timeout is exceeded."""
@@ -17,44 +30,112 @@ class ConnectionTimeoutError(Exception):
     pass
 
 
+def _is_unrecoverable(error: musicbrainzngs.NetworkError) -> bool:
+    """Whether a network error is one that retrying won't fix."""
+    # musicbrainzngs wraps urllib's URLError, which holds the socket error as its reason
+    cause = getattr(error, "cause", None)
+    reason = getattr(cause, "reason", None)
+    return any(
+        isinstance(exc, (socket.gaierror, ConnectionRefusedError))
+        for exc in (cause, reason)
+    )
+
+
 class MusicBrainzClient:
     """Main client for interacting with the MusicBrainz API, including rate limiting and retries."""
 
+    __slots__ = (
+        "last_request_time",
+        "_rate_limit_lock",
+        "rate_limit_delay",
+        "rate_limit_file",
+        "max_retries",
+        "initial_backoff",
+        "max_backoff",
+        "connection_timeout",
+        "excluded_release_types",
+        "included_release_types",
+        "_release_group_cache",
+        "_disk_cache",
+        "cache_expiry",
+    )
+
     def __init__(self, config: MusicBrainzConfig = MusicBrainzConfig()):
         musicbrainzngs.set_useragent(
             app=config.user_agent,
             version=config.version,
             contact=config.contact,
         )
-        self.last_request_time = 0
+        self.last_request_time = 0.0
+        self._rate_limit_lock = threading.Lock()
         self.rate_limit_delay = config.rate_limit_delay
+        self.rate_limit_file = getattr(config, "rate_limit_file", "")
         self.max_retries = config.max_retries
         self.initial_backoff = getattr(config, "initial_backoff", 1)
         self.max_backoff = getattr(config, "max_backoff", 60)
         self.connection_timeout = getattr(config, "connection_timeout", 300)
-        self.excluded_release_types = getattr(config, "excluded_release_types", [])
-        self.included_release_types = getattr(config, "included_release_types", [])
+        self.excluded_release_types = frozenset(
+            t.lower() for t in getattr(config, "excluded_release_types", [])
+        )
+        self.included_release_types = frozenset(
+            t.lower() for t in getattr(config, "included_release_types", [])
+        )
+        self._release_group_cache: OrderedDict[str, list[dict]] = OrderedDict()
+        cache_dir = getattr(config, "cache_dir", "")
+        self._disk_cache = diskcache.Cache(cache_dir) if cache_dir else None
+        self.cache_expiry = getattr(config, "cache_expiry_hours", 12) * 3600
 
     def _rate_limit(self):
         """Ensure we don't exceed the MusicBrainz rate limit of 1 request per second."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+        # Worker threads queue on the lock so the limit holds across the client
+        with self._rate_limit_lock:
+            if self.rate_limit_file:
+                self._shared_rate_limit()
+                return
+
+            time_since_last = time.monotonic() - self.last_request_time
+            if time_since_last < self.rate_limit_delay:
+                time.sleep(self.rate_limit_delay - time_since_last)
+
+            self.last_request_time = time.monotonic()
+
+    def _shared_rate_limit(self):
+        """Space requests using a timestamp file shared by every process on the host."""
+        import fcntl
 
-        if time_since_last < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last
-            time.sleep(sleep_time)
+        path = Path(self.rate_limit_file)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        with open(fd, "r+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                last_request_time = float(f.read() or 0)
+            except ValueError:
+                last_request_time = 0.0
+
+            # Wall-clock time: monotonic clocks aren't comparable across processes
+            time_since_last = time.time() - last_request_time
+            if 0 <= time_since_last < self.rate_limit_delay:
+                time.sleep(self.rate_limit_delay - time_since_last)
 
-        self.last_request_time = time.time()
+            f.seek(0)
+            f.truncate()
+            f.write(repr(time.time()))
+            f.flush()
 
     def _retry_with_backoff(self, func, *args, **kwargs):
         """Execute a function with exponential backoff retry."""
-        start_time = time.time()
+        max_retries = self.max_retries
+        initial_backoff = self.initial_backoff
+        max_backoff = self.max_backoff
+        connection_timeout = self.connection_timeout
+        start_time = time.monotonic()
 
-        for attempt in range(self.max_retries):
-            elapsed_time = time.time() - start_time
-            if elapsed_time > self.connection_timeout:
+        for attempt in range(max_retries):
+            elapsed_time = time.monotonic() - start_time
+            if elapsed_time > connection_timeout:
                 raise ConnectionTimeoutError(
-                    f"Connection timeout exceeded ({self.connection_timeout}s)"
+                    f"Connection timeout exceeded ({connection_timeout}s)"
                 )
 
             try:
@@ -63,7 +144,7 @@ class MusicBrainzClient:
 
             except musicbrainzngs.NetworkError as e:
                 log.warning(f"Network error on attempt {attempt + 1}: {e}")
-                if attempt == self.max_retries - 1:
+                if attempt == max_retries - 1 or _is_unrecoverable(e):
                     raise
 
             except musicbrainzngs.ResponseError as e:
@@ -73,71 +154,129 @@ class MusicBrainzClient:
                     and e.cause.code == 429
                 ):
                     log.warning(f"Rate limit exceeded on attempt {attempt + 1}")
-                    if attempt == self.max_retries - 1:
+                    if attempt == max_retries - 1:
                         raise
                 else:
                     raise
 
             except Exception as e:
                 log.error(f"Unexpected error on attempt {attempt + 1}: {e}")
-                if attempt == self.max_retries - 1:
+                if attempt == max_retries - 1:
                     raise
 
             # Exponential backoff with jitter
-            sleep_time = min(self.initial_backoff * (2**attempt), self.max_backoff)
+            sleep_time = min(initial_backoff * (2**attempt), max_backoff)
             jitter = random.uniform(0.1, 0.3) * sleep_time
             time.sleep(sleep_time + jitter)
 
     def get_recent_releases(self, artist_id: str, days_back: int = 30) -> list[dict]:
         """Get releases from the last N days."""
-        cutoff_date = datetime.now() - timedelta(days=days_back)
-        return self._get_release_groups(artist_id, since_date=cutoff_date)
+        cutoff = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
+        return self._get_release_groups(artist_id, since_date=cutoff)
+
+    def close(self):
+        """Close the disk cache, if one is open."""
+        if self._disk_cache is not None:
+            self._disk_cache.close()
 
     def _get_release_groups(
-        self, artist_id: str, since_date: datetime | None = None
+        self, artist_id: str, since_date: str | None = None
     ) -> list[dict]:
-        """Fetch release groups for an artist."""
+        """Get an artist's release groups, released on or after since_date if given."""
+        # Fetch each discography once; date windows filter the cached copy
+        release_groups = self._release_group_cache.get(artist_id)
+        if release_groups is None:
+            release_groups, complete = self._load_release_groups(artist_id)
+            if complete:
+                self._release_group_cache[artist_id] = release_groups
+                if len(self._release_group_cache) > RELEASE_GROUP_CACHE_SIZE:
+                    self._release_group_cache.popitem(last=False)
+
+        if since_date is None:
+            return list(release_groups)
+
+        # ISO-8601 dates order lexicographically, so compare strings instead of
+        # parsing. Truncating the cutoff to each date's precision keeps YYYY-MM
+        # and YYYY dates whose month/year reaches the cutoff.
+        return [
+            rg
+            for rg in release_groups
+            if rg["first_release_date"] >= since_date[: len(rg["first_release_date"])]
+        ]
+
+    def _load_release_groups(self, artist_id: str) -> tuple[list[dict], bool]:
+        """Fetch (release groups, complete) for an artist through the disk cache."""
+        if self._disk_cache is None:
+            return self._fetch_release_groups(artist_id)
+
+        # Keyed on the type filters too, so changing them doesn't serve stale lists
+        key = (
+            "release-groups",
+            artist_id,
+            tuple(sorted(self.excluded_release_types)),
+            tuple(sorted(self.included_release_types)),
+        )
+        release_groups = self._disk_cache.get(key)
+        if release_groups is not None:
+            return release_groups, True
+
+        release_groups, complete = self._fetch_release_groups(artist_id)
+        # Caching a failed fetch would hide the artist's releases until expiry
+        if complete:
+            self._disk_cache.set(key, release_groups, expire=self.cache_expiry)
+        return release_groups, complete
+
+    def _fetch_release_groups(self, artist_id: str) -> tuple[list[dict], bool]:
+        """Fetch (dated, type-filtered release groups, complete) from the API."""
         results = []
         offset = 0
+        # Bound once; these are read for every release group on every page
+        append = results.append
+        excluded = self.excluded_release_types
+        included = self.included_release_types
+        parse_date = self._parse_date
+        debug = log.isEnabledFor(logging.DEBUG)
 
-        while True:
-            self._rate_limit()
+        fetch_page = functools.partial(
+            self._retry_with_backoff,
+            musicbrainzngs.browse_release_groups,
+            artist=artist_id,
+            limit=BROWSE_PAGE_SIZE,
+        )
 
+        while True:
             try:
-                response = self._retry_with_backoff(
-                    musicbrainzngs.browse_release_groups,
-                    artist=artist_id,
-                    offset=offset,
-                    limit=25,
-                )
+                response = fetch_page(offset=offset)
             except Exception as e:
                 log.error(f"Error fetching releases for {artist_id}: {e}")
-                break
+                return results, False
 
-            for rg in response.get("release-group-list", []):
-                # Skip if no release date
-                date_str = rg.get("first-release-date")
-                if not date_str:
-                    continue
+            # Stop on a short page or once the reported total is covered, so
+            # an exact multiple of the page size doesn't cost an empty request
+            release_groups = response.get("release-group-list", [])
+            offset += BROWSE_PAGE_SIZE
+            total = int(response.get("release-group-count", 0))
 
-                # Parse date
-                release_date = self._parse_date(date_str)
-                if not release_date:
+            for rg in release_groups:
+                # Filter by type first; it doesn't need the date parsed
+                release_type = rg.get("type", "").lower()
+                if release_type in excluded:
+                    if debug:
+                        log.debug(f"{rg['title']} ({release_type}) is in excluded release types. Skipping.")
+                    continue
+                if included and release_type not in included:
                     continue
 
-                # Filter by date
-                if since_date and release_date < since_date:
+                # Skip if no release date
+                date_str = rg.get("first-release-date")
+                if not date_str:
                     continue
 
-                # Filter by type
-                release_type = rg.get("type", "").lower()
-                if self.excluded_release_types and release_type in self.excluded_release_types:
-                   log.debug(f"{rg['title']} ({release_type}) is in excluded release types. Skipping.") 
-                   continue
-                if self.included_release_types and release_type not in self.included_release_types:
+                # Skip dates that can't be parsed
+                if not parse_date(date_str):
                     continue
 
-                results.append(
+                append(
                     {
                         "id": rg["id"],
                         "title": rg["title"],
@@ -146,18 +285,24 @@ class MusicBrainzClient:
                     }
                 )
 
-            if len(response.get("release-group-list", [])) < 25:
+            if len(release_groups) < BROWSE_PAGE_SIZE or offset >= total:
                 break
-            offset += 25
 
-        return results
+        return results, True
 
     @staticmethod
-    def _parse_date(date_str: str) -> datetime | None:
-        """Parse MusicBrainz date formats."""
-        for fmt in ["%Y-%m-%d", "%Y-%m", "%Y"]:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
+    @functools.lru_cache(maxsize=4096)
+    def _parse_date(date_str: str) -> date | None:
+        """Parse MusicBrainz date formats (YYYY-MM-DD, YYYY-MM or YYYY)."""
+        try:
+            if len(date_str) == 10:
+                return date(
+                    int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10])
+                )
+            if len(date_str) == 7:
+                return date(int(date_str[0:4]), int(date_str[5:7]), 1)
+            if len(date_str) == 4:
+                return date(int(date_str), 1, 1)
+        except ValueError:
+            pass
         return None
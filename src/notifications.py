@@ -2,16 +2,45 @@
 
 import requests
 import logging
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.config import HealthCheckConfig, NtfyConfig
 
 log = logging.getLogger(__name__)
 
+# Notifications sent at once by send_many; also the connection pool size, so
+# every worker gets a kept-alive connection
+MAX_PARALLEL_NOTIFICATIONS = 4
+
+
+def _make_session() -> requests.Session:
+    """Create a keep-alive session that retries transient failures."""
+    # Status retries keep urllib3's default methods, which exclude POST, so a
+    # notification the server may have accepted isn't sent twice
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+    )
+    adapter = HTTPAdapter(
+        pool_connections=MAX_PARALLEL_NOTIFICATIONS,
+        pool_maxsize=MAX_PARALLEL_NOTIFICATIONS,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 
 class NotificationClient:
     def __init__(self, config: NtfyConfig = NtfyConfig()):
         self.topic = config.topic
         self.token = config.token
+        self._session = _make_session()
 
     def send_release_notification(
         self,
@@ -21,17 +50,26 @@ class NotificationClient:
         release_type: str | None = None,
     ):
         """Send a notification for a new release."""
-        if release_type:
-            message = f"{release_date}: {artist_name} - {title} ({release_type})"
-        else:
-            message = f"{release_date}: {artist_name} - {title}"
+        return self.send_notification(
+            self.format_release(artist_name, title, release_date, release_type)
+        )
 
-        self.send_notification(message)
+    @staticmethod
+    def format_release(
+        artist_name: str,
+        title: str,
+        release_date: str,
+        release_type: str | None = None,
+    ) -> str:
+        """Build the notification text for a single release."""
+        if release_type:
+            return f"{release_date}: {artist_name} - {title} ({release_type})"
+        return f"{release_date}: {artist_name} - {title}"
 
-    def send_notification(self, message: str):
-        """Send a notification via ntfy."""
+    def send_notification(self, message: str) -> bool:
+        """Send a notification via ntfy. Returns True if it was accepted."""
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.topic,
                 data=message,
                 headers={
@@ -43,13 +81,21 @@ class NotificationClient:
 
             if response.status_code == 200:
                 log.info(f"Notification sent successfully: {message}")
-            else:
-                log.error(
-                    f"Failed to send notification. Status: {response.status_code}"
-                )
+                return True
+            log.error(f"Failed to send notification. Status: {response.status_code}")
 
         except requests.RequestException as e:
             log.error(f"Error sending notification: {e}")
+        return False
+
+    def send_many(self, messages: list[str]) -> Iterator[bool]:
+        """Send notifications concurrently, yielding whether each was accepted."""
+        if len(messages) <= 1:
+            yield from map(self.send_notification, messages)
+            return
+        workers = min(MAX_PARALLEL_NOTIFICATIONS, len(messages))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            yield from pool.map(self.send_notification, messages)
 
     def send_summary_notification(self, releases: list[dict]):
         """Send a summary notification for multiple releases."""
@@ -65,30 +111,33 @@ class NotificationClient:
                 release.get("release_type", None),
             )
         else:
-            # Send a summary for multiple releases
-            message = f"🎵 {len(releases)} new releases found:\n"
-            for release in releases[:5]:  # Limit to first 5 to avoid long messages
-                message += f"• {release['artist_name']} - {release['title']}\n"
-
+            # Send a summary for multiple releases, listing only the first 5 to
+            # avoid long messages
+            lines = [f"🎵 {len(releases)} new releases found:"]
+            lines.extend(
+                f"• {release['artist_name']} - {release['title']}"
+                for release in releases[:5]
+            )
             if len(releases) > 5:
-                message += f"... and {len(releases) - 5} more"
+                lines.append(f"... and {len(releases) - 5} more")
 
-            self.send_notification(message)
+            self.send_notification("\n".join(lines))
 
 
 class HealthCheck:
     def __init__(self, config: HealthCheckConfig = HealthCheckConfig()):
         self.url = config.url
         self.timeout = config.timeout
+        self._session = _make_session()
 
     def ping(self, success: bool = True):
         """Send a health check ping."""
         try:
             if success:
-                response = requests.get(self.url, timeout=self.timeout)
+                response = self._session.get(self.url, timeout=self.timeout)
             else:
                 # Send failure ping
-                response = requests.get(f"{self.url}/fail", timeout=self.timeout)
+                response = self._session.get(f"{self.url}/fail", timeout=self.timeout)
 
             if response.status_code == 200:
                 log.debug("Health check ping sent successfully")
@@ -103,7 +152,7 @@ class HealthCheck:
     def ping_start(self):
         """Send a start ping."""
         try:
-            requests.get(f"{self.url}/start", timeout=self.timeout)
+            self._session.get(f"{self.url}/start", timeout=self.timeout)
             log.debug("Health check start ping sent")
         except requests.RequestException as e:
             log.error(f"Error sending health check start ping: {e}")
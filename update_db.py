@@ -9,14 +9,23 @@ from src.database import NotificationDatabase
 app = typer.Typer()
 
 
-def search_artists(beets: BeetsReader, search_term: str) -> dict[str, str]:
-    """Search beets for artists matching the search term (case-insensitive)."""
-    all_artists = beets.get_all_artists_with_mb_ids()
+def build_artist_index(beets: BeetsReader) -> list[tuple[str, str, str]]:
+    """Read (lowercased name, name, mb_id) for every beets artist with an MB ID."""
+    return [
+        (name.lower(), name, mb_id)
+        for name, mb_id in beets.iter_artists_with_mb_ids()
+    ]
+
+
+def search_artists(
+    artist_index: list[tuple[str, str, str]], search_term: str
+) -> dict[str, str]:
+    """Search the artist index for names matching the search term (case-insensitive)."""
     search_lower = search_term.lower()
     return {
         name: mb_id
-        for name, mb_id in all_artists.items()
-        if search_lower in name.lower()
+        for name_lower, name, mb_id in artist_index
+        if search_lower in name_lower
     }
 
 
@@ -34,9 +43,10 @@ def ignore(
     db = NotificationDatabase(config.databases.notifications_db)
 
     # Collect matches for all search terms
+    artist_index = build_artist_index(beets)
     all_matches: dict[str, str] = {}
     for search_term in search_terms:
-        matches = search_artists(beets, search_term)
+        matches = search_artists(artist_index, search_term)
         if not matches:
             typer.echo(f"No artists found matching '{search_term}'")
         else:
@@ -46,10 +56,12 @@ def ignore(
         typer.echo("\nNo artists found for any search term.")
         raise typer.Exit(1)
 
+    # Look up which matches are already ignored in one query
+    ignored_ids = db.get_ignored_ids(all_matches.values())
+
     typer.echo(f"\nFound {len(all_matches)} artist(s) total:\n")
     for name, mb_id in all_matches.items():
-        ignored = db.is_artist_ignored(mb_id)
-        status = " [already ignored]" if ignored else ""
+        status = " [already ignored]" if mb_id in ignored_ids else ""
         typer.echo(f"  - {name}{status}")
         typer.echo(f"    MB ID: {mb_id}")
 
@@ -57,7 +69,7 @@ def ignore(
     to_ignore = {
         name: mb_id
         for name, mb_id in all_matches.items()
-        if not db.is_artist_ignored(mb_id)
+        if mb_id not in ignored_ids
     }
 
     if not to_ignore:
@@ -71,8 +83,8 @@ def ignore(
             typer.echo("Cancelled.")
             raise typer.Exit(0)
 
-    for name, mb_id in to_ignore.items():
-        db.ignore_artist(mb_id)
+    db.ignore_artists(to_ignore.values())
+    for name in to_ignore:
         typer.echo(f"Ignored: {name}")
 
     typer.echo(f"\nDone. Ignored {len(to_ignore)} artist(s).")
@@ -91,22 +103,24 @@ def unignore(
     beets = BeetsReader(config.databases.beets_db)
     db = NotificationDatabase(config.databases.notifications_db)
 
-    matches = search_artists(beets, search_term)
+    matches = search_artists(build_artist_index(beets), search_term)
 
     if not matches:
         typer.echo(f"No artists found matching '{search_term}'")
         raise typer.Exit(1)
 
+    # Look up which matches are ignored in one query
+    ignored_ids = db.get_ignored_ids(matches.values())
+
     typer.echo(f"\nFound {len(matches)} artist(s) matching '{search_term}':\n")
     for name, mb_id in matches.items():
-        ignored = db.is_artist_ignored(mb_id)
-        status = " [ignored]" if ignored else " [not ignored]"
+        status = " [ignored]" if mb_id in ignored_ids else " [not ignored]"
         typer.echo(f"  - {name}{status}")
         typer.echo(f"    MB ID: {mb_id}")
 
     # Filter to only ignored artists
     to_unignore = {
-        name: mb_id for name, mb_id in matches.items() if db.is_artist_ignored(mb_id)
+        name: mb_id for name, mb_id in matches.items() if mb_id in ignored_ids
     }
 
     if not to_unignore:
@@ -120,8 +134,8 @@ def unignore(
             typer.echo("Cancelled.")
             raise typer.Exit(0)
 
-    for name, mb_id in to_unignore.items():
-        db.unignore_artist(mb_id)
+    db.unignore_artists(to_unignore.values())
+    for name in to_unignore:
         typer.echo(f"Unignored: {name}")
 
     typer.echo(f"\nDone. Unignored {len(to_unignore)} artist(s).")
@@ -143,20 +157,20 @@ def list_ignored(
         typer.echo("No artists are currently ignored.")
         raise typer.Exit(0)
 
-    # Get artist names from beets for the ignored IDs
-    all_artists = beets.get_all_artists_with_mb_ids()
-    ignored_artists = {
-        name: mb_id for name, mb_id in all_artists.items() if mb_id in ignored_ids
-    }
+    # Get artist names from beets for the ignored IDs; the beets query
+    # groups by MB ID, so each ID maps to one name
+    names_by_id = {mb_id: name for name, mb_id in beets.iter_artists_with_mb_ids()}
+    ignored_artists = sorted(
+        (names_by_id[mb_id], mb_id) for mb_id in ignored_ids if mb_id in names_by_id
+    )
 
     typer.echo(f"\nIgnored artists ({len(ignored_ids)} total):\n")
-    for name, mb_id in sorted(ignored_artists.items()):
+    for name, mb_id in ignored_artists:
         typer.echo(f"  - {name}")
         typer.echo(f"    MB ID: {mb_id}")
 
     # Check for any ignored IDs not found in beets
-    found_ids = set(ignored_artists.values())
-    orphaned = ignored_ids - found_ids
+    orphaned = [mb_id for mb_id in ignored_ids if mb_id not in names_by_id]
     if orphaned:
         typer.echo(f"\n{len(orphaned)} ignored ID(s) not found in beets:")
         for mb_id in orphaned: